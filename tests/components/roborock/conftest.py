@@ -1,5 +1,6 @@
 """Global fixtures for Roborock integration."""
-from unittest.mock import patch
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -7,8 +8,9 @@ from homeassistant.components.roborock.const import (
     CONF_BASE_URL,
     CONF_USER_DATA,
     DOMAIN,
+    PLATFORMS,
 )
-from homeassistant.const import CONF_USERNAME
+from homeassistant.const import CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
@@ -25,69 +27,115 @@ from .mock_data import (
 
 from tests.common import MockConfigEntry
 
+# USER_DATA never changes, so serialize it once instead of on every
+# mock_roborock_entry invocation. ConfigEntry wraps data in a read-only
+# mapping, so the dict itself can also be shared between entries.
+_USER_DATA_DICT = USER_DATA.as_dict()
+_ENTRY_DATA = {
+    CONF_USERNAME: USER_EMAIL,
+    CONF_USER_DATA: _USER_DATA_DICT,
+    CONF_BASE_URL: BASE_URL,
+}
 
-@pytest.fixture(name="bypass_api_fixture")
-def bypass_api_fixture() -> None:
-    """Skip calls to the API."""
-    with patch(
-        "homeassistant.components.roborock.RoborockMqttClient.async_connect"
-    ), patch(
-        "homeassistant.components.roborock.RoborockMqttClient._send_command"
-    ), patch(
+
+# Built once at import so the fixture only has to enter the patchers,
+# not reconstruct them for every use.
+_BYPASS_API_PATCHES = (
+    patch(
+        "homeassistant.components.roborock.RoborockMqttClient.async_connect",
+        new=AsyncMock(),
+    ),
+    patch(
+        "homeassistant.components.roborock.RoborockMqttClient._send_command",
+        new=AsyncMock(),
+    ),
+    patch(
         "homeassistant.components.roborock.RoborockApiClient.get_home_data",
         return_value=HOME_DATA,
-    ), patch(
+    ),
+    patch(
         "homeassistant.components.roborock.RoborockMqttClient.get_networking",
         return_value=NETWORK_INFO,
-    ), patch(
+    ),
+    patch(
         "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_prop",
         return_value=PROP,
-    ), patch(
+    ),
+    patch(
         "homeassistant.components.roborock.coordinator.RoborockMqttClient.get_multi_maps_list",
         return_value=MULTI_MAP_LIST,
-    ), patch(
+    ),
+    patch(
         "homeassistant.components.roborock.image.RoborockMapDataParser.parse",
         return_value=MAP_DATA,
-    ), patch(
-        "homeassistant.components.roborock.coordinator.RoborockLocalClient.send_message"
-    ), patch(
-        "homeassistant.components.roborock.RoborockMqttClient._wait_response"
-    ), patch(
-        "homeassistant.components.roborock.coordinator.RoborockLocalClient._wait_response"
-    ), patch(
-        "roborock.api.AttributeCache.async_value",
-    ), patch(
-        "roborock.api.AttributeCache.value",
-    ), patch(
-        "homeassistant.components.roborock.image.MAP_SLEEP",
-        0,
-    ):
+    ),
+    patch(
+        "homeassistant.components.roborock.coordinator.RoborockLocalClient.send_message",
+        new=AsyncMock(),
+    ),
+    patch(
+        "homeassistant.components.roborock.RoborockMqttClient._wait_response",
+        new=AsyncMock(),
+    ),
+    patch(
+        "homeassistant.components.roborock.coordinator.RoborockLocalClient._wait_response",
+        new=AsyncMock(),
+    ),
+    patch("roborock.api.AttributeCache.async_value", new=AsyncMock()),
+    patch("roborock.api.AttributeCache.value"),
+    patch("homeassistant.components.roborock.image.MAP_SLEEP", 0),
+)
+
+
+@pytest.fixture(name="_bypass_api_patches", scope="session")
+def bypass_api_patches() -> None:
+    """Enter the shared API patch stack once per session.
+
+    The patched return values are module-level constants that the tests
+    never mutate, so the stack is safe to share across the whole session.
+    """
+    with ExitStack() as stack:
+        for bypass_patch in _BYPASS_API_PATCHES:
+            stack.enter_context(bypass_patch)
         yield
 
 
+@pytest.fixture(name="bypass_api_fixture")
+def bypass_api_fixture(_bypass_api_patches: None) -> None:
+    """Skip calls to the API.
+
+    Function scoped on purpose: per-test overrides layer on top of the
+    session-wide patch stack without re-entering it.
+    """
+
+
 @pytest.fixture
 def mock_roborock_entry(hass: HomeAssistant) -> MockConfigEntry:
     """Create a Roborock Entry that has not been setup."""
     mock_entry = MockConfigEntry(
         domain=DOMAIN,
         title=USER_EMAIL,
-        data={
-            CONF_USERNAME: USER_EMAIL,
-            CONF_USER_DATA: USER_DATA.as_dict(),
-            CONF_BASE_URL: BASE_URL,
-        },
+        data=_ENTRY_DATA,
     )
     mock_entry.add_to_hass(hass)
     return mock_entry
 
 
+@pytest.fixture
+def platforms() -> list[Platform]:
+    """Platforms to set up; override in a test module to load a subset."""
+    return PLATFORMS
+
+
 @pytest.fixture
 async def setup_entry(
     hass: HomeAssistant,
     bypass_api_fixture,
     mock_roborock_entry: MockConfigEntry,
+    platforms: list[Platform],
 ) -> MockConfigEntry:
     """Set up the Roborock platform."""
-    assert await async_setup_component(hass, DOMAIN, {})
-    await hass.async_block_till_done()
-    return mock_roborock_entry
+    with patch("homeassistant.components.roborock.PLATFORMS", platforms):
+        assert await async_setup_component(hass, DOMAIN, {})
+        await hass.async_block_till_done()
+        yield mock_roborock_entry
@@ -32,7 +32,8 @@ async def test_floorplan_image(
     now = dt_util.utcnow() + timedelta(seconds=91)
     async_fire_time_changed(hass, now)
     # Copy the device prop so we don't override it
-    prop = copy.deepcopy(PROP)
+    prop = copy.copy(PROP)
+    prop.status = copy.copy(PROP.status)
     prop.status.in_cleaning = 1
     with patch(
         "homeassistant.components.roborock.coordinator.RoborockLocalClient.get_prop",
@@ -54,12 +55,13 @@ async def test_floorplan_image_failed_parse(
 ) -> None:
     """Test that we correctly handle getting None from the image parser."""
     client = await hass_client()
-    map_data = copy.deepcopy(MAP_DATA)
+    map_data = copy.copy(MAP_DATA)
     map_data.image = None
     now = dt_util.utcnow() + timedelta(seconds=91)
     async_fire_time_changed(hass, now)
     # Copy the device prop so we don't override it
-    prop = copy.deepcopy(PROP)
+    prop = copy.copy(PROP)
+    prop.status = copy.copy(PROP.status)
     prop.status.in_cleaning = 1
     # Update image, but get none for parse image.
     with patch(